@@ -9,41 +9,135 @@ The code, documentation, and all related files were created with the assistance
 import sys
 import re
 import os
-import base64
+import errno
+import time
+import functools
+import threading
+import queue
 import argparse
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterator, Tuple
 
+# Modules only needed for AI naming (openai, PIL, base64 helpers, thread pool)
+# are imported inside the functions that use them, keeping default startup fast.
 
+
+# Compiled once at import so folder scans don't re-parse patterns per file.
+# Covers "Screenshot ...", "Screen Shot ..." (png) and "CleanShot ..." (png/jpg/jpeg).
+# Matched against the lowercased filename, so the pattern is all lowercase.
+_SCREENSHOT_RE = re.compile(r'^(?:cleanshot.*\.(?:png|jpe?g)|screen ?shot.*\.png)$')
+
+# Cheap string gates checked before the regex
+_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+_SCREENSHOT_PREFIXES = ('screenshot', 'screen shot', 'cleanshot')
+
+# Read size for base64 encoding; a multiple of 3 so encoded chunks concatenate cleanly
+_B64_CHUNK_SIZE = 57 * 1024
+
+# Images larger than this are shrunk before upload (requires Pillow)
+_DOWNSAMPLE_MIN_BYTES = 512 * 1024
+_DOWNSAMPLE_MAX_SIZE = (1024, 1024)
+_DOWNSAMPLE_JPEG_QUALITY = 85
+
+# A filename of at most 50 characters fits comfortably in 20 tokens
+_AI_MODEL = "gpt-4o"
+_AI_MAX_TOKENS = 20
+
+# Concurrent OpenAI requests when analyzing a folder, and attempts per image on rate limiting
+_AI_MAX_WORKERS = 10
+_AI_MAX_ATTEMPTS = 3
+
+# Batch API status polling interval (doubles after each check, up to the max)
+_BATCH_POLL_INITIAL_SECONDS = 10
+_BATCH_POLL_MAX_SECONDS = 300
+
+# Guards first-time client construction when called from worker threads
+_openai_client_lock = threading.Lock()
+
+# Filename cleanup for AI-generated descriptions: any run of invalid characters
+# and/or hyphens becomes a single hyphen
+_CLEAN_RE = re.compile(r'\W+')
+
+# Patterns for different screenshot tools:
+# "Screenshot 2024-01-01 at 10.00.00 AM.png"
+# "CleanShot 2024-01-01 at 10.00.00 AM.png"
+# "CleanShot X 2024-01-01 at 10.00.00 AM.png" (with version)
+_DT_RE = re.compile(
+    r'(?:Screenshot|CleanShot)(?:\s+\w+)?\s+(\d{4})-(\d{2})-(\d{2})\s+at\s+(\d{1,2})\.(\d{2})\.(\d{2})\s+([AP])M',
+    re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def is_screenshot_file(filename: str) -> bool:
     """Check if a file is a macOS screenshot based on naming pattern."""
-    screenshot_patterns = [
-        r'^Screenshot \d{4}-\d{2}-\d{2} at \d{1,2}\.\d{2}\.\d{2} (AM|PM)\.png$',
-        r'^Screen Shot \d{4}-\d{2}-\d{2} at \d{1,2}\.\d{2}\.\d{2} (AM|PM)\.png$',
-        r'^CleanShot.*\.png$',
-        r'^CleanShot.*\.jpg$',
-        r'^CleanShot.*\.jpeg$',
-        r'^Screenshot.*\.png$',
-        r'^Screen Shot.*\.png$',
-    ]
-    
     filename_lower = filename.lower()
-    if not (filename_lower.endswith('.png') or filename_lower.endswith('.jpg') or 
-            filename_lower.endswith('.jpeg')):
+    # Most files in a folder fail these, so skip the regex for them
+    if not filename_lower.endswith(_IMAGE_EXTENSIONS):
         return False
+    if not filename_lower.startswith(_SCREENSHOT_PREFIXES):
+        return False
+    
+    return bool(_SCREENSHOT_RE.match(filename_lower))
+
+
+def encode_image_base64(image_path: Path) -> str:
+    """Base64-encode an image file in chunks.
+    
+    This avoids holding the raw file bytes alongside the encoding. The encoded
+    bytes and the decoded str still coexist briefly, so peak memory is only a
+    little lower than encoding the whole file at once (about 7%).
+    """
+    import binascii
+    
+    encoded = bytearray()
+    with open(image_path, "rb") as image_file:
+        while True:
+            chunk = image_file.read(_B64_CHUNK_SIZE)
+            if not chunk:
+                break
+            encoded += binascii.b2a_base64(chunk, newline=False)
+    return encoded.decode('ascii')
+
+
+def downsample_image_base64(image_path: Path) -> Optional[str]:
+    """Shrink an image to a JPEG thumbnail and base64-encode it.
     
-    for pattern in screenshot_patterns:
-        if re.match(pattern, filename, re.IGNORECASE):
-            return True
+    Returns None if Pillow is not installed or cannot process the image,
+    so callers can send the original.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    import binascii
+    import io
     
-    return False
+    # Image.Resampling only exists in Pillow >= 9.1; older releases expose LANCZOS on Image
+    resample = getattr(Image, "Resampling", Image).LANCZOS
+    try:
+        with Image.open(image_path) as img:
+            img.thumbnail(_DOWNSAMPLE_MAX_SIZE, resample)
+            buffer = io.BytesIO()
+            img.convert("RGB").save(buffer, format="JPEG", quality=_DOWNSAMPLE_JPEG_QUALITY)
+    except Exception:
+        # Unreadable format, decompression-bomb limit on huge captures, etc.
+        return None
+    return binascii.b2a_base64(buffer.getvalue(), newline=False).decode('ascii')
 
 
-def analyze_image_with_openai(image_path: Path) -> Optional[str]:
-    """Analyze image content using OpenAI Vision API and generate a descriptive filename."""
+@functools.lru_cache(maxsize=1)
+def _openai_client(api_key: str):
+    """Return a shared OpenAI client so connections are reused across requests."""
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
+
+def _get_openai_client():
+    """Return the shared OpenAI client, or None (after reporting why) if unavailable."""
     try:
-        from openai import OpenAI
+        import openai  # noqa: F401
     except ImportError:
         print("❌ Error: openai package not installed. Install it with: pip install openai")
         return None
@@ -55,14 +149,12 @@ def analyze_image_with_openai(image_path: Path) -> Optional[str]:
         print("   Set it with: export OPENAI_API_KEY='your-api-key'")
         return None
     
-    # Read and encode image
-    try:
-        with open(image_path, "rb") as image_file:
-            image_data = base64.b64encode(image_file.read()).decode('utf-8')
-    except Exception as e:
-        print(f"❌ Error reading image file: {e}")
-        return None
-    
+    with _openai_client_lock:
+        return _openai_client(api_key)
+
+
+def _build_vision_messages(image_path: Path) -> Optional[list]:
+    """Build the chat messages asking the model to name the given image."""
     # Determine image format
     image_format = image_path.suffix.lower()
     if image_format == '.jpg' or image_format == '.jpeg':
@@ -72,106 +164,265 @@ def analyze_image_with_openai(image_path: Path) -> Optional[str]:
     else:
         mime_type = 'image/png'  # default
     
-    client = OpenAI(api_key=api_key)
-    
+    # Read and encode image, shrinking large (e.g. Retina) screenshots first
     try:
-        print("🤖 Analyzing image content with OpenAI...")
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
+        image_data = None
+        if image_path.stat().st_size > _DOWNSAMPLE_MIN_BYTES:
+            image_data = downsample_image_base64(image_path)
+            if image_data:
+                mime_type = 'image/jpeg'
+        if image_data is None:
+            image_data = encode_image_base64(image_path)
+    except Exception as e:
+        print(f"❌ Error reading image file: {e}")
+        return None
+    
+    return [
+        {
+            "role": "user",
+            "content": [
+                {
+                    "type": "text",
+                    "text": "Analyze this screenshot and generate a concise, descriptive filename (without extension). "
+                           "The filename should be: "
+                           "- Short and descriptive (max 50 characters) "
+                           "- Use lowercase letters, numbers, hyphens, and underscores only "
+                           "- No spaces (use hyphens or underscores) "
+                           "- Describe the main content or purpose of the screenshot "
+                           "Examples: 'login-page', 'error-message', 'dashboard-view', 'code-snippet'"
+                },
+                # Chat Completions only takes images inline (data URL) or by public
+                # URL; uploaded file IDs are not accepted as image content here
                 {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": "Analyze this screenshot and generate a concise, descriptive filename (without extension). "
-                                   "The filename should be: "
-                                   "- Short and descriptive (max 50 characters) "
-                                   "- Use lowercase letters, numbers, hyphens, and underscores only "
-                                   "- No spaces (use hyphens or underscores) "
-                                   "- Describe the main content or purpose of the screenshot "
-                                   "Examples: 'login-page', 'error-message', 'dashboard-view', 'code-snippet'"
-                        },
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:{mime_type};base64,{image_data}"
-                            }
-                        }
-                    ]
+                    "type": "image_url",
+                    "image_url": {
+                        "url": f"data:{mime_type};base64,{image_data}",
+                        "detail": "low"
+                    }
                 }
-            ],
-            max_tokens=50
-        )
+            ]
+        }
+    ]
+
+
+def _clean_ai_description(description: str) -> Optional[str]:
+    """Turn the model's reply into a valid filename stem."""
+    description = description.strip()
+    
+    # Clean up the description to make it a valid filename
+    # Remove any file extension if present
+    description = description.split('.')[0]
+    # Replace spaces and invalid characters with single hyphens, trim hyphens, limit length
+    description = _CLEAN_RE.sub('-', description).strip('-')[:50]
+    
+    if not description:
+        return None
+    
+    return description.lower()
+
+
+def analyze_image_with_openai(image_path: Path) -> Optional[str]:
+    """Analyze image content using OpenAI Vision API and generate a descriptive filename."""
+    client = _get_openai_client()
+    if client is None:
+        return None
+    from openai import APIConnectionError, InternalServerError, RateLimitError
+    
+    messages = _build_vision_messages(image_path)
+    if messages is None:
+        return None
+    
+    try:
+        # Back off exponentially (1s, 2s, ...) on rate limits and transient
+        # failures (dropped connections, timeouts, 5xx). The SDK's own retries
+        # are disabled for this call so this loop is the only retry layer.
+        no_retry_client = client.with_options(max_retries=0)
+        for attempt in range(_AI_MAX_ATTEMPTS):
+            try:
+                response = no_retry_client.chat.completions.create(
+                    model=_AI_MODEL,
+                    messages=messages,
+                    max_tokens=_AI_MAX_TOKENS
+                )
+                break
+            except (RateLimitError, APIConnectionError, InternalServerError):
+                if attempt == _AI_MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(2 ** attempt)
         
-        description = response.choices[0].message.content.strip()
+        return _clean_ai_description(response.choices[0].message.content)
         
-        # Clean up the description to make it a valid filename
-        # Remove any file extension if present
-        description = description.split('.')[0]
-        # Replace spaces and invalid characters with hyphens
-        description = re.sub(r'[^\w\-]', '-', description)
-        # Replace multiple hyphens with single hyphen
-        description = re.sub(r'-+', '-', description)
-        # Remove leading/trailing hyphens
-        description = description.strip('-')
-        # Limit length
-        description = description[:50]
+    except Exception as e:
+        print(f"❌ Error calling OpenAI API for {image_path.name}: {e}")
+        return None
+
+
+def analyze_images_with_openai(image_paths: List[Path]) -> Dict[Path, Optional[str]]:
+    """Analyze several images concurrently, returning the AI-generated name for each path."""
+    import concurrent.futures
+    
+    print(f"🤖 Analyzing {len(image_paths)} image(s) with OpenAI...")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_AI_MAX_WORKERS) as executor:
+        futures = {path: executor.submit(analyze_image_with_openai, path) for path in image_paths}
+        return {path: future.result() for path, future in futures.items()}
+
+
+def analyze_images_with_openai_batch(image_paths: List[Path]) -> Dict[Path, Optional[str]]:
+    """Analyze images through the OpenAI Batch API.
+    
+    Batch requests cost about half as much but may take up to 24 hours; this
+    blocks until the batch finishes. Returns the AI-generated name for each path.
+    """
+    import json
+    import tempfile
+    
+    results = {path: None for path in image_paths}
+    client = _get_openai_client()
+    if client is None:
+        return results
+    
+    input_file_id = None
+    batch = None
+    try:
+        # One /v1/chat/completions request per line, keyed by index into image_paths
+        paths_by_id = {}
+        with tempfile.TemporaryFile() as batch_file:
+            for index, path in enumerate(image_paths):
+                messages = _build_vision_messages(path)
+                if messages is None:
+                    continue
+                custom_id = str(index)
+                paths_by_id[custom_id] = path
+                request = {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {"model": _AI_MODEL, "messages": messages, "max_tokens": _AI_MAX_TOKENS}
+                }
+                batch_file.write(json.dumps(request).encode('utf-8') + b"\n")
+            
+            if not paths_by_id:
+                return results
+            
+            batch_file.seek(0)
+            input_file_id = client.files.create(
+                file=("airenamer-batch.jsonl", batch_file), purpose="batch"
+            ).id
+        
+        batch = client.batches.create(
+            input_file_id=input_file_id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"📦 Submitted batch {batch.id} with {len(paths_by_id)} image(s). Waiting for results...")
         
-        if not description:
-            return None
+        # Poll with exponential backoff, capped so long batches are still checked regularly
+        delay = _BATCH_POLL_INITIAL_SECONDS
+        try:
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(delay)
+                delay = min(delay * 2, _BATCH_POLL_MAX_SECONDS)
+                batch = client.batches.retrieve(batch.id)
+                print(f"   Batch status: {batch.status}")
+        except KeyboardInterrupt:
+            # Nobody is waiting for the results anymore, so stop paying for them
+            print(f"\n⚠️  Interrupted. Cancelling batch {batch.id}...")
+            try:
+                client.batches.cancel(batch.id)
+            except Exception as e:
+                print(f"❌ Error cancelling batch {batch.id}: {e}")
+            raise
         
-        return description.lower()
+        if batch.status != "completed" or not batch.output_file_id:
+            print(f"❌ Error: Batch {batch.id} finished with status '{batch.status}'")
+            return results
         
+        output = client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            # A bad line (malformed JSON, refusal with no content, ...) only
+            # costs that one file its AI name
+            path = None
+            try:
+                item = json.loads(line)
+                path = paths_by_id.get(item.get("custom_id"))
+                response = item.get("response") or {}
+                if path is None or response.get("status_code") != 200:
+                    continue
+                content = response["body"]["choices"][0]["message"]["content"]
+                if content:
+                    results[path] = _clean_ai_description(content)
+            except Exception as e:
+                name = path.name if path is not None else "unknown file"
+                print(f"⚠️  Warning: Could not read batch result for {name}: {e}")
     except Exception as e:
-        print(f"❌ Error calling OpenAI API: {e}")
-        return None
+        print(f"❌ Error calling OpenAI Batch API: {e}")
+    finally:
+        # Don't leave the uploaded screenshots or their results in OpenAI file storage
+        file_ids = [input_file_id]
+        if batch is not None:
+            file_ids += [batch.output_file_id, batch.error_file_id]
+        for file_id in file_ids:
+            if not file_id:
+                continue
+            try:
+                client.files.delete(file_id)
+            except Exception as e:
+                print(f"⚠️  Warning: Could not delete OpenAI file {file_id}: {e}")
+    
+    return results
 
 
 def extract_datetime_from_screenshot(filename: str) -> Optional[datetime]:
     """Extract datetime from macOS screenshot filename."""
-    # Patterns for different screenshot tools:
-    # "Screenshot 2024-01-01 at 10.00.00 AM.png"
-    # "CleanShot 2024-01-01 at 10.00.00 AM.png"
-    # "CleanShot X 2024-01-01 at 10.00.00 AM.png" (with version)
-    patterns = [
-        r'(?:Screenshot|CleanShot)(?:\s+\w+)?\s+(\d{4})-(\d{2})-(\d{2})\s+at\s+(\d{1,2})\.(\d{2})\.(\d{2})\s+(AM|PM)',
-    ]
+    match = _DT_RE.search(filename)
+    if not match:
+        return None
     
-    for pattern in patterns:
-        match = re.search(pattern, filename, re.IGNORECASE)
-        if match:
-            year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
-            hour, minute, second = int(match.group(4)), int(match.group(5)), int(match.group(6))
-            am_pm = match.group(7).upper()
-            
-            # Convert to 24-hour format
-            if am_pm == 'PM' and hour != 12:
-                hour += 12
-            elif am_pm == 'AM' and hour == 12:
-                hour = 0
-            
-            try:
-                return datetime(year, month, day, hour, minute, second)
-            except ValueError:
-                continue
+    year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
+    hour, minute, second = int(match.group(4)), int(match.group(5)), int(match.group(6))
+    
+    # Convert to 24-hour format (12 AM -> 0, 12 PM -> 12). Hours outside 1-12
+    # keep the original handling: unchanged for AM, +12 for PM (13+ PM then
+    # fails validation below)
+    is_pm = match.group(7) in ('P', 'p')
+    if 1 <= hour <= 12:
+        hour = hour % 12 + (12 if is_pm else 0)
+    elif is_pm:
+        hour += 12
     
-    return None
+    try:
+        return datetime(year, month, day, hour, minute, second)
+    except ValueError:
+        return None
+
+
+def _split_extension(filename: str) -> Tuple[str, str]:
+    """Split a filename into (stem, extension), like Path.stem/Path.suffix without building a Path."""
+    dot = filename.rfind('.')
+    if 0 < dot < len(filename) - 1:
+        return filename[:dot], filename[dot:]
+    return filename, ''
 
 
 def generate_new_name(old_name: str, pattern: str = "datetime", prefix: str = "", 
-                      suffix: str = "", file_path: Optional[Path] = None) -> str:
-    """Generate a new name for the screenshot."""
-    file_ext = Path(old_name).suffix
-    base_name = Path(old_name).stem
+                      suffix: str = "", file_path: Optional[Path] = None,
+                      ai_name: Optional[str] = None) -> str:
+    """Generate a new name for the screenshot.
+    
+    For the AI pattern, pass a precomputed ``ai_name`` to skip calling OpenAI.
+    """
+    base_name, file_ext = _split_extension(old_name)
     
     if pattern == "ai" or pattern == "content":
         # Use OpenAI to analyze image content
-        if file_path is None:
+        if ai_name is None and file_path is None:
             print("⚠️  Warning: File path required for AI pattern. Falling back to datetime.")
             pattern = "datetime"
         else:
-            ai_name = analyze_image_with_openai(file_path)
+            if ai_name is None:
+                ai_name = analyze_image_with_openai(file_path)
             if ai_name:
                 new_name = ai_name
                 # Skip to prefix/suffix handling
@@ -212,41 +463,108 @@ def generate_new_name(old_name: str, pattern: str = "datetime", prefix: str = ""
     return f"{new_name}{file_ext}"
 
 
+def _scan_directories(directory: Path, recursive: bool, entries_queue: queue.Queue) -> None:
+    """Read directory listings and queue each one as a list of DirEntry objects."""
+    try:
+        pending = [directory]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    batch = list(entries)
+            except OSError as e:
+                print(f"⚠️  Warning: Cannot read directory: {e}")
+                continue
+            if recursive:
+                for entry in batch:
+                    # is_dir() can fall back to an lstat, which may fail; skip that
+                    # entry rather than letting the scanner thread die mid-walk
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                    except OSError as e:
+                        print(f"⚠️  Warning: Cannot read directory: {e}")
+            entries_queue.put(batch)
+    finally:
+        entries_queue.put(None)
+
+
+def iter_screenshots(directory: Path, recursive: bool = False) -> Iterator[Path]:
+    """Yield screenshot files in a directory as they are found (unordered).
+    
+    Directories are listed in a background thread, so reading the next
+    directory overlaps with filtering the current one.
+    """
+    # Unbounded so the scanner never blocks if the caller stops iterating early
+    entries_queue = queue.Queue()
+    threading.Thread(
+        target=_scan_directories, args=(directory, recursive, entries_queue), daemon=True
+    ).start()
+    
+    while True:
+        batch = entries_queue.get()
+        if batch is None:
+            break
+        # DirEntry caches the file type, so non-matching entries never need a stat call.
+        # The extension check is case-sensitive, as the original glob("*.png") was,
+        # so folder runs leave *.PNG / *.JPG files alone.
+        for entry in batch:
+            if (entry.name.endswith(_IMAGE_EXTENSIONS)
+                    and entry.is_file(follow_symlinks=False)
+                    and is_screenshot_file(entry.name)):
+                yield Path(entry.path)
+
+
 def find_screenshots(directory: Path, recursive: bool = False) -> List[Path]:
     """Find all screenshot files in a directory."""
-    screenshots = []
-    
-    if recursive:
-        files = list(directory.glob("**/*.png")) + list(directory.glob("**/*.jpg")) + list(directory.glob("**/*.jpeg"))
-    else:
-        files = list(directory.glob("*.png")) + list(directory.glob("*.jpg")) + list(directory.glob("*.jpeg"))
-    
-    for file_path in files:
-        if file_path.is_file() and is_screenshot_file(file_path.name):
-            screenshots.append(file_path)
-    
-    return sorted(screenshots)
+    return sorted(iter_screenshots(directory, recursive))
 
 
-def rename_screenshot(file_path: Path, new_name: str, dry_run: bool = False) -> bool:
-    """Rename a screenshot file."""
-    new_path = file_path.parent / new_name
-    
-    if new_path.exists():
-        print(f"⚠️  Warning: {new_name} already exists. Skipping {file_path.name}")
-        return False
-    
-    if dry_run:
-        print(f"Would rename: {file_path.name} -> {new_name}")
-        return True
-    
-    try:
-        file_path.rename(new_path)
-        print(f"✅ Renamed: {file_path.name} -> {new_name}")
-        return True
-    except Exception as e:
-        print(f"❌ Error renaming {file_path.name}: {e}")
-        return False
+def _rename_no_replace(src: Path, dst: Path) -> None:
+    """Rename src to dst, raising FileExistsError instead of overwriting dst."""
+    # os.rename silently replaces an existing target on POSIX, so check first.
+    # A real rename (rather than link + unlink) keeps sync clients such as
+    # iCloud Desktop seeing a rename instead of a delete plus a new file.
+    # lexists: a dangling symlink still occupies the name.
+    if os.path.lexists(dst):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(dst))
+    os.rename(src, dst)
+
+
+def rename_screenshot(file_path: Path, new_name: str, dry_run: bool = False,
+                      force: bool = False) -> bool:
+    """Rename a screenshot file.
+    
+    With ``force``, a number suffix (_001, _002, ...) is added while the target name is taken.
+    """
+    name_parts = _split_extension(new_name)
+    target_name = new_name
+    counter = 1
+    
+    while True:
+        new_path = file_path.parent / target_name
+        
+        if dry_run:
+            if not new_path.exists():
+                print(f"Would rename: {file_path.name} -> {target_name}")
+                return True
+        else:
+            # Try each candidate in turn; a taken name raises FileExistsError
+            try:
+                _rename_no_replace(file_path, new_path)
+                print(f"✅ Renamed: {file_path.name} -> {target_name}")
+                return True
+            except FileExistsError:
+                pass
+            except Exception as e:
+                print(f"❌ Error renaming {file_path.name}: {e}")
+                return False
+        
+        if not force:
+            print(f"⚠️  Warning: {target_name} already exists. Skipping {file_path.name}")
+            return False
+        
+        target_name = f"{name_parts[0]}_{counter:03d}{name_parts[1]}"
+        counter += 1
 
 
 def main():
@@ -273,6 +591,9 @@ Examples:
   # Use AI to analyze content and generate descriptive name
   airenamer screenshot.png --pattern ai
 
+  # Name a large folder with AI via the (cheaper, slower) Batch API
+  airenamer --folder ~/Desktop --pattern ai --batch
+
   # Rename all screenshots in a folder
   airenamer --folder ~/Desktop
 
@@ -307,6 +628,13 @@ Examples:
         help="Naming pattern (default: datetime). Use 'ai' or 'content' for OpenAI-based naming."
     )
     
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit AI requests through the OpenAI Batch API (about half the cost, "
+             "but can take up to 24 hours; only with --pattern ai/content)"
+    )
+    
     parser.add_argument(
         "--prefix",
         type=str,
@@ -342,13 +670,14 @@ Examples:
     if args.file and args.folder:
         parser.error("Cannot specify both file and --folder. Use one or the other.")
     
+    if args.batch and args.pattern not in ["ai", "content"]:
+        parser.error("--batch can only be used with --pattern ai or content")
+    
     files_to_process = []
     
     if args.folder:
         # Process folder
-        folder_path = Path(args.folder).expanduser()
-        if not folder_path.is_absolute():
-            folder_path = Path.cwd() / folder_path
+        folder_path = Path(os.path.abspath(os.path.expanduser(args.folder)))
         
         if not folder_path.exists():
             print(f"❌ Error: Folder not found: {folder_path}")
@@ -367,9 +696,8 @@ Examples:
         print(f"Found {len(files_to_process)} screenshot(s) to process\n")
     else:
         # Process single file
-        file_path = Path(args.file).expanduser()
-        if not file_path.is_absolute():
-            file_path = Path.cwd() / file_path
+        # abspath rather than resolve(): a symlinked file must be renamed itself, not its target
+        file_path = Path(os.path.abspath(os.path.expanduser(args.file)))
         
         if not file_path.exists():
             print(f"❌ Error: File not found: {file_path}")
@@ -389,30 +717,33 @@ Examples:
         
         files_to_process = [file_path]
     
+    # Analyze images up front so the OpenAI requests run concurrently
+    ai_names = {}
+    if args.pattern in ["ai", "content"]:
+        if args.batch:
+            ai_names = analyze_images_with_openai_batch(files_to_process)
+        else:
+            ai_names = analyze_images_with_openai(files_to_process)
+    
     # Process all files
     success_count = 0
     for file_path in files_to_process:
+        pattern = args.pattern
+        if pattern in ["ai", "content"] and not ai_names[file_path]:
+            print("⚠️  Warning: Failed to analyze image. Falling back to datetime.")
+            pattern = "datetime"
+        
         # Generate new name
         new_name = generate_new_name(
             file_path.name,
-            pattern=args.pattern,
+            pattern=pattern,
             prefix=args.prefix,
             suffix=args.suffix,
-            file_path=file_path if args.pattern in ["ai", "content"] else None
+            ai_name=ai_names.get(file_path)
         )
         
-        # Handle duplicates if force is set
-        if args.force:
-            base_path = file_path.parent / new_name
-            counter = 1
-            while base_path.exists():
-                name_parts = Path(new_name).stem, Path(new_name).suffix
-                new_name = f"{name_parts[0]}_{counter:03d}{name_parts[1]}"
-                base_path = file_path.parent / new_name
-                counter += 1
-        
         # Rename the file
-        if rename_screenshot(file_path, new_name, args.dry_run):
+        if rename_screenshot(file_path, new_name, args.dry_run, args.force):
             success_count += 1
     
     if args.dry_run: